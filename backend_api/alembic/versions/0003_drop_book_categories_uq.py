@@ -0,0 +1,28 @@
+"""Drop redundant unique constraint on book_categories.
+
+Revision ID: 0003_drop_book_categories_uq
+Revises: 0001_initial
+Create Date: 2025-01-15 00:10:00
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0003_drop_book_categories_uq"
+down_revision = "0001_initial"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # (book_id, category_id) is already the composite primary key, so the extra unique
+    # constraint only duplicated its index. Batch mode lets SQLite recreate the table.
+    with op.batch_alter_table("book_categories") as batch_op:
+        batch_op.drop_constraint("uq_book_categories_book_id_category_id", type_="unique")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("book_categories") as batch_op:
+        batch_op.create_unique_constraint("uq_book_categories_book_id_category_id", ["book_id", "category_id"])
@@ -0,0 +1,30 @@
+"""Drop single-column user_id indexes covered by (user_id, book_id) unique constraints.
+
+Revision ID: 0004_drop_user_id_indexes
+Revises: 0003_drop_book_categories_uq
+Create Date: 2025-01-15 00:20:00
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0004_drop_user_id_indexes"
+down_revision = "0003_drop_book_categories_uq"
+branch_labels = None
+depends_on = None
+
+# Each of these tables has UNIQUE (user_id, book_id), whose index already serves
+# user-scoped lookups through its leading column. ix_*_book_id indexes are kept.
+_TABLES = ("wishlists", "purchases", "libraries", "reading_progress")
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.drop_index(f"ix_{table}_user_id", table_name=table)
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.create_index(f"ix_{table}_user_id", table, ["user_id"], unique=False)
@@ -0,0 +1,55 @@
+"""Trigram GIN indexes for substring search (PostgreSQL only).
+
+Revision ID: 0005_trigram_search_indexes
+Revises: 0004_drop_user_id_indexes
+Create Date: 2025-01-20 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0005_trigram_search_indexes"
+down_revision = "0004_drop_user_id_indexes"
+branch_labels = None
+depends_on = None
+
+# (index name, table, column) for every column searched with ILIKE '%...%'.
+_TRGM_INDEXES = (
+    ("ix_books_title_trgm", "books", "title"),
+    ("ix_books_author_trgm", "books", "author"),
+    ("ix_books_description_trgm", "books", "description"),
+    ("ix_categories_name_trgm", "categories", "name"),
+    ("ix_categories_slug_trgm", "categories", "slug"),
+)
+
+
+def upgrade() -> None:
+    # Leading-wildcard ILIKE cannot use B-tree indexes; pg_trgm GIN indexes serve it
+    # directly. SQLite has no equivalent, so this revision is a no-op there.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for name, table, column in _TRGM_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        for name, table, _column in reversed(_TRGM_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    # The pg_trgm extension is left installed; other objects may depend on it.
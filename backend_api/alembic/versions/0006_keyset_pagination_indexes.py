@@ -0,0 +1,33 @@
+"""Composite indexes matching keyset pagination sort orders.
+
+Revision ID: 0006_keyset_indexes
+Revises: 0005_trigram_search_indexes
+Create Date: 2025-01-20 00:10:00
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0006_keyset_indexes"
+down_revision = "0005_trigram_search_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Each index matches an ORDER BY ... , id used by a list endpoint, so both page and
+    # cursor queries become bounded index range scans (read backwards for DESC orders).
+    op.create_index("ix_books_created_at_id", "books", ["created_at", "id"], unique=False)
+    op.create_index("ix_libraries_user_id_created_at_id", "libraries", ["user_id", "created_at", "id"], unique=False)
+    # (name, id) serves every lookup the single-column name index did.
+    op.create_index("ix_categories_name_id", "categories", ["name", "id"], unique=False)
+    op.drop_index("ix_categories_name", table_name="categories")
+
+
+def downgrade() -> None:
+    op.create_index("ix_categories_name", "categories", ["name"], unique=False)
+    op.drop_index("ix_categories_name_id", table_name="categories")
+    op.drop_index("ix_libraries_user_id_created_at_id", table_name="libraries")
+    op.drop_index("ix_books_created_at_id", table_name="books")
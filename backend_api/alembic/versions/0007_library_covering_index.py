@@ -0,0 +1,39 @@
+"""Make the per-user library listing index covering on PostgreSQL.
+
+Revision ID: 0007_library_covering_index
+Revises: 0006_keyset_indexes
+Create Date: 2025-01-22 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0007_library_covering_index"
+down_revision = "0006_keyset_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # INCLUDE (PostgreSQL 11+) carries the remaining libraries columns the paginated fetch
+    # selects, so the libraries side runs as an index-only scan; books is joined by primary key.
+    # SQLite has no INCLUDE columns, so the plain (user_id, created_at, id) index stays there.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_libraries_user_id_created_at_id", table_name="libraries")
+    op.create_index(
+        "ix_libraries_user_id_created_at_id",
+        "libraries",
+        ["user_id", "created_at", "id"],
+        unique=False,
+        postgresql_include=["book_id", "source", "updated_at"],
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_libraries_user_id_created_at_id", table_name="libraries")
+    op.create_index("ix_libraries_user_id_created_at_id", "libraries", ["user_id", "created_at", "id"], unique=False)
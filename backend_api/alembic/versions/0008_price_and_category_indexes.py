@@ -0,0 +1,31 @@
+"""Indexes for price range filters and category-to-book lookups.
+
+Revision ID: 0008_price_category_indexes
+Revises: 0007_library_covering_index
+Create Date: 2025-01-22 00:10:00
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0008_price_category_indexes"
+down_revision = "0007_library_covering_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # price_min/price_max filters become index range scans.
+    op.create_index("ix_books_price_cents", "books", ["price_cents"], unique=False)
+    # The primary key leads with book_id; filtering books by category needs category_id first.
+    # Including book_id makes the join side an index-only scan.
+    op.create_index(
+        "ix_book_categories_category_id_book_id", "book_categories", ["category_id", "book_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_book_categories_category_id_book_id", table_name="book_categories")
+    op.drop_index("ix_books_price_cents", table_name="books")
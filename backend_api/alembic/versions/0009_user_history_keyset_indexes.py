@@ -0,0 +1,36 @@
+"""Composite indexes for keyset pagination of purchases, wishlists and reading progress.
+
+Revision ID: 0009_user_history_keyset_idx
+Revises: 0008_price_category_indexes
+Create Date: 2025-01-23 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0009_user_history_keyset_idx"
+down_revision = "0008_price_category_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Each index matches a per-user list ordering (sort column DESC, id DESC), so page and
+    # cursor queries become bounded index range scans read backwards.
+    op.create_index(
+        "ix_purchases_user_id_created_at_id", "purchases", ["user_id", "created_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_wishlists_user_id_created_at_id", "wishlists", ["user_id", "created_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_reading_progress_user_id_updated_at_id", "reading_progress", ["user_id", "updated_at", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reading_progress_user_id_updated_at_id", table_name="reading_progress")
+    op.drop_index("ix_wishlists_user_id_created_at_id", table_name="wishlists")
+    op.drop_index("ix_purchases_user_id_created_at_id", table_name="purchases")
@@ -0,0 +1,38 @@
+"""Store reading progress as SmallInteger basis points instead of a float percentage.
+
+Revision ID: 0010_progress_basis_points
+Revises: 0009_user_history_keyset_idx
+Create Date: 2025-01-24 00:00:00
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0010_progress_basis_points"
+down_revision = "0009_user_history_keyset_idx"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "reading_progress",
+        sa.Column("progress_percent_bp", sa.SmallInteger(), nullable=False, server_default=sa.text("0")),
+    )
+    op.execute("UPDATE reading_progress SET progress_percent_bp = CAST(ROUND(progress_percent * 100) AS INTEGER)")
+    # Batch mode lets SQLite recreate the table without the old column.
+    with op.batch_alter_table("reading_progress") as batch_op:
+        batch_op.drop_column("progress_percent")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "reading_progress",
+        sa.Column("progress_percent", sa.Float(), nullable=False, server_default=sa.text("0.0")),
+    )
+    op.execute("UPDATE reading_progress SET progress_percent = progress_percent_bp / 100.0")
+    with op.batch_alter_table("reading_progress") as batch_op:
+        batch_op.drop_column("progress_percent_bp")
@@ -0,0 +1,34 @@
+"""Partial index on unfinished reading progress.
+
+Revision ID: 0011_reading_in_progress_idx
+Revises: 0010_progress_basis_points
+Create Date: 2025-01-25 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0011_reading_in_progress_idx"
+down_revision = "0010_progress_basis_points"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves the is_completed=false reading list (user_id, updated_at DESC, id DESC) while
+    # indexing only books still being read; finished rows pay no maintenance for it.
+    op.create_index(
+        "ix_reading_progress_in_progress",
+        "reading_progress",
+        ["user_id", "updated_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("NOT is_completed"),
+        sqlite_where=sa.text("is_completed = 0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reading_progress_in_progress", table_name="reading_progress")
@@ -0,0 +1,29 @@
+"""Check constraint keeping reading progress within 0-100%.
+
+Revision ID: 0012_progress_range_check
+Revises: 0011_reading_in_progress_idx
+Create Date: 2025-01-26 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0012_progress_range_check"
+down_revision = "0011_reading_in_progress_idx"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Batch mode lets SQLite recreate the table with the constraint.
+    with op.batch_alter_table("reading_progress") as batch_op:
+        batch_op.create_check_constraint(
+            op.f("ck_reading_progress_progress_percent_bp_range"), "progress_percent_bp BETWEEN 0 AND 10000"
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("reading_progress") as batch_op:
+        batch_op.drop_constraint(op.f("ck_reading_progress_progress_percent_bp_range"), type_="check")
@@ -0,0 +1,30 @@
+"""Covering index for BookSummary lookups (PostgreSQL only).
+
+Revision ID: 0014_book_summary_covering_idx
+Revises: 0013_drop_book_name_btrees
+Create Date: 2025-01-28 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0014_book_summary_covering_idx"
+down_revision = "0013_drop_book_name_btrees"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # User lists join each row to books for (id, title, author) only; INCLUDE (PostgreSQL 11+)
+    # lets those probes run as index-only scans. SQLite has no INCLUDE columns.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.create_index("ix_books_id_summary", "books", ["id"], unique=False, postgresql_include=["title", "author"])
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_books_id_summary", table_name="books")
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from typing import List
+from contextlib import asynccontextmanager
+from typing import AbstractSet, AsyncIterator
 
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
+from src.api.middleware import ETagMiddleware
 from src.core.config import get_settings
 from src.api.routers.auth import router as auth_router
 from src.api.routers.books import router as books_router
@@ -52,6 +56,14 @@ openapi_tags = [
     },
 ]
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Size the worker threadpool that runs the sync endpoints and their DB calls."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+    yield
+
+
 app = FastAPI(
     title=settings.project_name,
     description=settings.description,
@@ -60,10 +72,17 @@ app = FastAPI(
     docs_url=settings.docs_url,
     redoc_url=settings.redoc_url,
     openapi_url=settings.openapi_url,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
-# Configure CORS
-allow_origins: List[str] = settings.cors_origins if settings.cors_origins else ["*"]
+# Conditional GET support: content-hash ETags and 304 responses. Registered before CORS so
+# that CORS stays the outermost layer and decorates 304 responses too.
+app.add_middleware(ETagMiddleware)
+
+# Configure CORS. Explicit origins are passed as a frozenset so Starlette's per-request
+# "origin in allow_origins" check is a hash lookup; "*" is already short-circuited by it.
+allow_origins: AbstractSet[str] = frozenset(settings.cors_origins) if settings.cors_origins else frozenset({"*"})
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allow_origins,
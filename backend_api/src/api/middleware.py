@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import hashlib
+from typing import List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header value against an ETag (RFC 9110 13.1.2)."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+class ETagMiddleware:
+    """
+    ASGI middleware adding content-hash ETags to successful GET responses.
+
+    Bodies of 200 responses are hashed (BLAKE2b, 128-bit) into an ETag. When the
+    request's If-None-Match matches, a bodiless 304 Not Modified is sent instead,
+    so unchanged resources cost no response bytes. Other methods and statuses, and
+    responses that already carry an ETag, pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+        passthrough = False
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                if message["status"] != 200 or "etag" in Headers(raw=message["headers"]):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start = message
+                return
+
+            # http.response.body: buffer until the final chunk, then hash the full body.
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            body = b"".join(chunks)
+            etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+            assert start is not None
+            headers = MutableHeaders(scope=start)
+            headers["etag"] = etag
+            if if_none_match and _etag_matches(if_none_match, etag):
+                del headers["content-length"]
+                del headers["content-type"]
+                start["status"] = 304
+                body = b""
+            await send(start)
+            await send({"type": "http.response.body", "body": body, "more_body": False})
+
+        await self.app(scope, receive, send_with_etag)
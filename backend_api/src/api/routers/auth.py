@@ -55,6 +55,9 @@ def login(payload: LoginRequest, db: Session = Depends(get_db)) -> AuthResponse:
         HTTPException 401: If credentials are invalid or user is inactive.
     """
     user = db.scalar(select(User).where(User.email == payload.email))
+    # Nothing else needs the database: hand the connection back to the pool before the
+    # deliberately slow bcrypt check so concurrent logins don't hold connections idle.
+    db.close()
     if not user or not auth_service.verify_password(payload.password, user.hashed_password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
     if not user.is_active:
@@ -92,7 +95,7 @@ def refresh_tokens(payload: RefreshRequest, db: Session = Depends(get_db)) -> Au
     if not user_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token subject")
 
-    user = db.scalar(select(User).where(User.id == user_id))
+    user = db.get(User, user_id)
     if not user or not user.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Inactive or missing user")
 
@@ -1,19 +1,52 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy import and_, func, or_, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session, raiseload, undefer_group
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.db.session import get_db
+from src.models.associations import book_category_association
 from src.models.book import Book
 from src.models.category import Category
 from src.schemas.book import BookCreate, BookRead, BookUpdate
-from src.utils.pagination import PageMeta, Paginated, offset_limit, sanitize_pagination
+from src.services.category_cache import get_category_id_by_slug
+from src.utils.pagination import PageMeta, Paginated, fetch_page, orm_page_response, paginated_response
 
 router = APIRouter(prefix="/books", tags=["Books"])
 
+_BOOK_LIST_ADAPTER = TypeAdapter(List[BookRead])
+
+# BookRead renders the deferred description and media URLs, so undefer both groups.
+# Relationships are never loaded implicitly; BookRead's categories are attached by _load_categories.
+_BOOK_LOAD_OPTIONS = (undefer_group("body"), undefer_group("media"), raiseload("*"))
+
+
+def _load_categories(db: Session, books: Sequence[Book]) -> None:
+    """
+    Populate Book.categories for the given books with a single query.
+
+    Equivalent to selectinload(Book.categories), except that the association table is
+    joined straight to categories; the selectin loader also joins back to books, which
+    adds a table to every category prefetch without contributing any columns.
+    """
+    if not books:
+        return
+    by_id: Dict[str, List[Category]] = {book.id: [] for book in books}
+    stmt = (
+        select(book_category_association.c.book_id, Category)
+        .join(Category, Category.id == book_category_association.c.category_id)
+        .where(book_category_association.c.book_id.in_(list(by_id)))
+        .options(raiseload("*"))
+    )
+    for book_id, category in db.execute(stmt):
+        by_id[book_id].append(category)
+    for book in books:
+        set_committed_value(book, "categories", by_id[book.id])
+
 
 def _apply_book_filters(
     base_stmt,
@@ -21,7 +54,6 @@ def _apply_book_filters(
     q: Optional[str],
     author: Optional[str],
     category_id: Optional[str],
-    category_slug: Optional[str],
     price_min: Optional[int],
     price_max: Optional[int],
 ):
@@ -39,14 +71,11 @@ def _apply_book_filters(
         conditions.append(Book.price_cents <= int(price_max))
 
     used_join = False
-    if category_id or category_slug:
-        # Join to categories for filtering
-        base_stmt = base_stmt.join(Book.categories)
+    if category_id:
+        # Membership only needs the association table; categories itself is not joined.
+        base_stmt = base_stmt.join(book_category_association, book_category_association.c.book_id == Book.id)
         used_join = True
-        if category_id:
-            conditions.append(Category.id == category_id)
-        if category_slug:
-            conditions.append(Category.slug == category_slug)
+        conditions.append(book_category_association.c.category_id == category_id)
 
     if conditions:
         base_stmt = base_stmt.where(and_(*conditions))
@@ -58,7 +87,10 @@ def _apply_book_filters(
     "",
     response_model=Paginated[BookRead],
     summary="List books",
-    description="List books with search and filters for category, author, and price. Supports pagination.",
+    description=(
+        "List books with search and filters for category, author, and price. Supports page-based pagination "
+        "and keyset pagination via the opaque `cursor` returned in `meta.next_cursor`."
+    ),
 )
 def list_books(
     q: Optional[str] = Query(default=None, description="Search text across title, author, and description"),
@@ -69,8 +101,9 @@ def list_books(
     price_max: Optional[int] = Query(default=None, ge=0, description="Maximum price in cents"),
     page: int = Query(default=1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(default=None, description="Keyset cursor from meta.next_cursor; overrides page"),
     db: Session = Depends(get_db),
-) -> Paginated[BookRead]:
+) -> Response:
     """
     List books with search, filters, and pagination.
 
@@ -83,42 +116,41 @@ def list_books(
         price_max: Maximum price (cents).
         page: Page number.
         page_size: Items per page.
+        cursor: Keyset cursor; when given, the page after it is returned without totals.
 
     Returns:
         Paginated[BookRead]: Paginated list of books.
     """
-    page, page_size = sanitize_pagination(page, page_size)
-
-    # Build base select
-    base = select(Book).options(selectinload(Book.categories))
-    base, used_join = _apply_book_filters(
-        base, q=q, author=author, category_id=category_id, category_slug=category_slug, price_min=price_min, price_max=price_max
-    )
-
-    # Count distinct books under same filters (avoid duplicates because of joins)
-    count_base = select(func.count(func.distinct(Book.id)))
-    if used_join:
-        count_base = count_base.select_from(Book).join(Book.categories)
-    else:
-        count_base = count_base.select_from(Book)
-
-    count_base, _ = _apply_book_filters(
-        count_base,
-        q=q,
-        author=author,
-        category_id=category_id,
-        category_slug=category_slug,
-        price_min=price_min,
-        price_max=price_max,
+    if category_slug:
+        # Slugs resolve to ids through the per-process cache, so no categories lookup joins the query.
+        slug_category_id = get_category_id_by_slug(db, category_slug)
+        if slug_category_id is None or (category_id and category_id != slug_category_id):
+            # Unknown slug, or a slug naming a different category than category_id: nothing matches.
+            meta = PageMeta.build(total=None if cursor else 0, page=page, page_size=page_size, next_cursor=None)
+            return paginated_response(Paginated[BookRead](items=[], meta=meta))
+        category_id = slug_category_id
+
+    filters = dict(q=q, author=author, category_id=category_id, price_min=price_min, price_max=price_max)
+
+    # Build base select. The category join matches at most one association row per book
+    # (its primary key is (book_id, category_id)), so rows are never duplicated and a window
+    # count gives the total.
+    base, _ = _apply_book_filters(select(Book).options(*_BOOK_LOAD_OPTIONS), **filters)
+    count_stmt, _ = _apply_book_filters(select(func.count(Book.id)).select_from(Book), **filters)
+    items, meta = fetch_page(
+        db,
+        base,
+        model=Book,
+        sort_column=Book.created_at,
+        descending=True,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        count_stmt=count_stmt,
+        window_total=True,
     )
-    total: int = int(db.execute(count_base).scalar() or 0)
-
-    off, lim = offset_limit(page, page_size)
-    stmt = base.order_by(Book.created_at.desc()).offset(off).limit(lim)
-    items: List[Book] = list(db.execute(stmt).scalars().all())
-
-    meta = PageMeta.build(total=total, page=page, page_size=page_size)
-    return Paginated[BookRead](items=[BookRead.model_validate(b) for b in items], meta=meta)
+    _load_categories(db, items)
+    return orm_page_response(Paginated[BookRead], _BOOK_LIST_ADAPTER, items, meta)
 
 
 # PUBLIC_INTERFACE
@@ -139,10 +171,10 @@ def create_book(payload: BookCreate, db: Session = Depends(get_db)) -> BookRead:
     Returns:
         The created Book.
     """
-    book = Book(**payload.model_dump())
+    # A new book has no categories; setting the empty collection avoids a lazy load on serialize.
+    book = Book(**payload.model_dump(), categories=[])
     db.add(book)
     db.commit()
-    db.refresh(book)
     return BookRead.model_validate(book)
 
 
@@ -164,10 +196,11 @@ def get_book(book_id: str, db: Session = Depends(get_db)) -> BookRead:
     Returns:
         BookRead
     """
-    stmt = select(Book).options(selectinload(Book.categories)).where(Book.id == book_id)
+    stmt = select(Book).options(*_BOOK_LOAD_OPTIONS).where(Book.id == book_id)
     book = db.execute(stmt).scalars().first()
     if not book:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
+    _load_categories(db, [book])
     return BookRead.model_validate(book)
 
 
@@ -190,7 +223,7 @@ def update_book(book_id: str, payload: BookUpdate, db: Session = Depends(get_db)
     Returns:
         Updated Book.
     """
-    book = db.get(Book, book_id)
+    book = db.get(Book, book_id, options=_BOOK_LOAD_OPTIONS)
     if not book:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
 
@@ -200,7 +233,7 @@ def update_book(book_id: str, payload: BookUpdate, db: Session = Depends(get_db)
 
     db.add(book)
     db.commit()
-    db.refresh(book)
+    _load_categories(db, [book])
     return BookRead.model_validate(book)
 
 
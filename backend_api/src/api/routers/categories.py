@@ -1,19 +1,34 @@
 from __future__ import annotations
 
-import re
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
-from sqlalchemy import func, or_, select
+from pydantic import TypeAdapter
+from sqlalchemy import exists, func, or_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from src.db.session import get_db
 from src.models.category import Category
 from src.schemas.category import CategoryCreate, CategoryRead, CategoryUpdate
-from src.utils.pagination import PageMeta, Paginated, offset_limit, sanitize_pagination
+from src.utils.pagination import Paginated, fetch_page, orm_page_response
 
 router = APIRouter(prefix="/categories", tags=["Categories"])
 
+_CATEGORY_LIST_ADAPTER = TypeAdapter(List[CategoryRead])
+
+
+class _SlugTable(dict):
+    """str.translate table keeping [a-z0-9] and mapping every other code point to '-'."""
+
+    def __missing__(self, key: int) -> str:
+        # Not stored: names are client input, so caching every code point seen would grow
+        # this module-level table without bound.
+        return "-"
+
+
+_SLUG_TABLE = _SlugTable({ord(ch): ch for ch in "abcdefghijklmnopqrstuvwxyz0123456789"})
+
 
 def _slugify(value: str) -> str:
     """
@@ -24,10 +39,10 @@ def _slugify(value: str) -> str:
     - Collapse multiple hyphens
     - Trim leading/trailing hyphens
     """
-    value = value.strip().lower()
-    value = re.sub(r"[^a-z0-9]+", "-", value)
-    value = re.sub(r"-{2,}", "-", value).strip("-")
-    return value or "category"
+    value = value.lower().translate(_SLUG_TABLE)
+    while "--" in value:
+        value = value.replace("--", "-")
+    return value.strip("-") or "category"
 
 
 # PUBLIC_INTERFACE
@@ -35,14 +50,18 @@ def _slugify(value: str) -> str:
     "",
     response_model=Paginated[CategoryRead],
     summary="List categories",
-    description="List all categories with optional search and pagination.",
+    description=(
+        "List all categories with optional search. Supports page-based pagination and keyset pagination "
+        "via the opaque `cursor` returned in `meta.next_cursor`."
+    ),
 )
 def list_categories(
     q: Optional[str] = Query(default=None, description="Search query (matches name or slug)"),
     page: int = Query(default=1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(default=None, description="Keyset cursor from meta.next_cursor; overrides page"),
     db: Session = Depends(get_db),
-) -> Paginated[CategoryRead]:
+) -> Response:
     """
     List categories with optional text search and pagination.
 
@@ -50,12 +69,11 @@ def list_categories(
         q: Optional search string (matches name or slug).
         page: Page number (1-based).
         page_size: Items per page.
+        cursor: Keyset cursor; when given, the page after it is returned without totals.
 
     Returns:
         Paginated[CategoryRead]: Paginated list of categories.
     """
-    page, page_size = sanitize_pagination(page, page_size)
-
     filters = []
     if q:
         like = f"%{q}%"
@@ -65,18 +83,18 @@ def list_categories(
     if filters:
         base_stmt = base_stmt.where(*filters)
 
-    # Count total
-    count_stmt = select(func.count()).select_from(
-        select(Category.id).where(*filters).subquery() if filters else select(Category.id).subquery()
+    items, meta = fetch_page(
+        db,
+        base_stmt,
+        model=Category,
+        sort_column=Category.name,
+        descending=False,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        count_stmt=select(func.count(Category.id)).where(*filters),
     )
-    total: int = int(db.execute(count_stmt).scalar() or 0)
-
-    off, lim = offset_limit(page, page_size)
-    stmt = base_stmt.order_by(Category.name.asc()).offset(off).limit(lim)
-    items: List[Category] = list(db.execute(stmt).scalars().all())
-
-    meta = PageMeta.build(total=total, page=page, page_size=page_size)
-    return Paginated[CategoryRead](items=[CategoryRead.model_validate(c) for c in items], meta=meta)
+    return orm_page_response(Paginated[CategoryRead], _CATEGORY_LIST_ADAPTER, items, meta)
 
 
 # PUBLIC_INTERFACE
@@ -100,15 +118,14 @@ def create_category(payload: CategoryCreate, db: Session = Depends(get_db)) -> C
     """
     slug = payload.slug or _slugify(payload.name)
 
-    # Check uniqueness of slug
-    exists_stmt = select(Category).where(Category.slug == slug)
-    if db.scalar(exists_stmt):
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Category slug already exists")
-
+    # Slug uniqueness is enforced by the unique index; a duplicate fails the INSERT.
     category = Category(name=payload.name, slug=slug)
     db.add(category)
-    db.commit()
-    db.refresh(category)
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Category slug already exists") from e
     return CategoryRead.model_validate(category)
 
 
@@ -196,15 +213,19 @@ def update_category(category_id: str, payload: CategoryUpdate, db: Session = Dep
         new_slug = category.slug
 
     if new_slug != category.slug:
-        # Enforce uniqueness
-        exists_stmt = select(Category).where(Category.slug == new_slug, Category.id != category.id)
-        if db.scalar(exists_stmt):
+        # Enforce uniqueness (EXISTS only probes the slug index)
+        taken = db.scalar(select(exists().where(Category.slug == new_slug, Category.id != category.id)))
+        if taken:
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Category slug already exists")
         category.slug = new_slug
 
     db.add(category)
-    db.commit()
-    db.refresh(category)
+    try:
+        db.commit()
+    except IntegrityError as e:
+        # Lost a race with a concurrent writer claiming the same slug.
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Category slug already exists") from e
     return CategoryRead.model_validate(category)
 
 
@@ -4,20 +4,24 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from pydantic import BaseModel as PydBaseModel
-from pydantic import Field
-from sqlalchemy import Select, and_, func, or_, select
-from sqlalchemy.orm import Session, selectinload
+from pydantic import Field, TypeAdapter
+from sqlalchemy import Select, and_, delete, func, or_, select
+from sqlalchemy.orm import Session
 
+from src.db.dialect import dialect_insert
+from src.db.loading import get_book_summary, owned_row_stmt, summary_load_options
 from src.db.session import get_db
 from src.models.book import Book
 from src.models.library import Library
 from src.models.user import User
 from src.schemas.library import LibraryRead
 from src.services.auth_service import get_current_user
-from src.utils.pagination import PageMeta, Paginated, offset_limit, sanitize_pagination
+from src.utils.pagination import Paginated, fetch_page, orm_page_response
 
 router = APIRouter(prefix="/library", tags=["Library"])
 
+_LIBRARY_LIST_ADAPTER = TypeAdapter(List[LibraryRead])
+
 
 class LibraryAddRequest(PydBaseModel):
     """Request payload for adding a book to the current user's library."""
@@ -25,16 +29,15 @@ class LibraryAddRequest(PydBaseModel):
     source: str = Field(default="manual", description="Source of the library entry (e.g., purchase, manual, gift)")
 
 
+_LIBRARY_LOAD_OPTIONS = summary_load_options(Library)
+
+
 def _query_user_library_base(user_id: str) -> Select:
     """Build a base select for a user's library with relationships preloaded."""
-    return (
-        select(Library)
-        .options(
-            selectinload(Library.book),
-            selectinload(Library.user),
-        )
-        .where(Library.user_id == user_id)
-    )
+    return select(Library).options(*_LIBRARY_LOAD_OPTIONS).where(Library.user_id == user_id)
+
+
+_GET_LIBRARY_ENTRY_STMT = owned_row_stmt(Library, Library.id, "entry_id")
 
 
 # PUBLIC_INTERFACE
@@ -42,15 +45,19 @@ def _query_user_library_base(user_id: str) -> Select:
     "",
     response_model=Paginated[LibraryRead],
     summary="List library",
-    description="List the authenticated user's library with pagination and optional search by book title/author.",
+    description=(
+        "List the authenticated user's library with optional search by book title/author. Supports page-based "
+        "pagination and keyset pagination via the opaque `cursor` returned in `meta.next_cursor`."
+    ),
 )
 def list_library(
     q: Optional[str] = Query(default=None, description="Search across book title and author"),
     page: int = Query(default=1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(default=None, description="Keyset cursor from meta.next_cursor; overrides page"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> Paginated[LibraryRead]:
+) -> Response:
     """
     List library entries for the current user with optional text search.
 
@@ -58,12 +65,11 @@ def list_library(
         q: Optional search query across book title and author.
         page: Page number (1-based).
         page_size: Items per page.
+        cursor: Keyset cursor; when given, the page after it is returned without totals.
 
     Returns:
         Paginated[LibraryRead]
     """
-    page, page_size = sanitize_pagination(page, page_size)
-
     base = _query_user_library_base(current_user.id)
     count_stmt: Select
     if q:
@@ -75,14 +81,18 @@ def list_library(
     else:
         count_stmt = select(func.count(Library.id)).where(Library.user_id == current_user.id)
 
-    total: int = int(db.scalar(count_stmt) or 0)
-
-    off, lim = offset_limit(page, page_size)
-    stmt = base.order_by(Library.created_at.desc()).offset(off).limit(lim)
-    items: List[Library] = list(db.execute(stmt).scalars().all())
-
-    meta = PageMeta.build(total=total, page=page, page_size=page_size)
-    return Paginated[LibraryRead](items=[LibraryRead.model_validate(l) for l in items], meta=meta)
+    items, meta = fetch_page(
+        db,
+        base,
+        model=Library,
+        sort_column=Library.created_at,
+        descending=True,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        count_stmt=count_stmt,
+    )
+    return orm_page_response(Paginated[LibraryRead], _LIBRARY_LIST_ADAPTER, items, meta)
 
 
 # PUBLIC_INTERFACE
@@ -116,20 +126,21 @@ def add_to_library(
         HTTPException 404: Book not found.
         HTTPException 409: Already in library.
     """
-    book = db.get(Book, payload.book_id)
+    book = get_book_summary(db, payload.book_id)
     if not book:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
 
-    exists = db.scalar(
-        select(Library).where(Library.user_id == current_user.id, Library.book_id == payload.book_id)
+    stmt = (
+        dialect_insert(db, Library)
+        .values(user_id=current_user.id, book_id=payload.book_id, source=payload.source or "manual")
+        .on_conflict_do_nothing(index_elements=[Library.user_id, Library.book_id])
+        .returning(Library)
     )
-    if exists:
+    entry = db.scalars(stmt).first()
+    if entry is None:
+        db.rollback()
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Book already in library")
-
-    entry = Library(user_id=current_user.id, book_id=payload.book_id, source=payload.source or "manual")
-    db.add(entry)
     db.commit()
-    db.refresh(entry)
     return LibraryRead.model_validate(entry)
 
 
@@ -158,12 +169,7 @@ def get_library_entry(
     Raises:
         HTTPException 404: If not found or not owned by user.
     """
-    stmt = (
-        select(Library)
-        .options(selectinload(Library.book), selectinload(Library.user))
-        .where(Library.id == entry_id, Library.user_id == current_user.id)
-    )
-    entry = db.execute(stmt).scalars().first()
+    entry = db.scalars(_GET_LIBRARY_ENTRY_STMT, {"entry_id": entry_id, "user_id": current_user.id}).first()
     if not entry:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Library entry not found")
     return LibraryRead.model_validate(entry)
@@ -194,9 +200,12 @@ def remove_from_library(
     Raises:
         HTTPException 404: If not found or not owned by user.
     """
-    entry = db.get(Library, entry_id)
-    if not entry or entry.user_id != current_user.id:
+    # Ownership check and delete in one statement; no row returned means not found or not owned.
+    deleted_id = db.execute(
+        delete(Library).where(Library.id == entry_id, Library.user_id == current_user.id).returning(Library.id)
+    ).scalar_one_or_none()
+    if deleted_id is None:
+        db.rollback()
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Library entry not found")
-    db.delete(entry)
     db.commit()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,33 +1,36 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy import Select, func, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session
 
+from src.db.dialect import dialect_insert
+from src.db.loading import get_book_summary, owned_row_stmt, summary_load_options
 from src.db.session import get_db
-from src.models.book import Book
 from src.models.library import Library
 from src.models.purchase import Purchase
 from src.models.user import User
 from src.schemas.purchase import PurchaseCreate, PurchaseRead
 from src.services.auth_service import get_current_user
-from src.utils.pagination import PageMeta, Paginated, offset_limit, sanitize_pagination
+from src.utils.pagination import Paginated, fetch_page, orm_page_response
 
 router = APIRouter(prefix="/purchases", tags=["Purchases"])
 
+_PURCHASE_LIST_ADAPTER = TypeAdapter(List[PurchaseRead])
+
+
+_PURCHASE_LOAD_OPTIONS = summary_load_options(Purchase)
+
 
 def _query_user_purchases_base(user_id: str) -> Select:
     """Build a base select for a user's purchases with relationships preloaded."""
-    return (
-        select(Purchase)
-        .options(
-            selectinload(Purchase.book),
-            selectinload(Purchase.user),
-        )
-        .where(Purchase.user_id == user_id)
-    )
+    return select(Purchase).options(*_PURCHASE_LOAD_OPTIONS).where(Purchase.user_id == user_id)
+
+
+_GET_PURCHASE_STMT = owned_row_stmt(Purchase, Purchase.id, "purchase_id")
 
 
 # PUBLIC_INTERFACE
@@ -35,34 +38,44 @@ def _query_user_purchases_base(user_id: str) -> Select:
     "",
     response_model=Paginated[PurchaseRead],
     summary="List purchases",
-    description="List the authenticated user's purchases with pagination.",
+    description=(
+        "List the authenticated user's purchases. Supports page-based pagination and keyset pagination via the "
+        "opaque `cursor` returned in `meta.next_cursor`; set `include_total=false` to skip counting."
+    ),
 )
 def list_purchases(
     page: int = Query(default=1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(default=None, description="Keyset cursor from meta.next_cursor; overrides page"),
+    include_total: bool = Query(default=True, description="Count total items (ignored when paging by cursor)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> Paginated[PurchaseRead]:
+) -> Response:
     """
     List purchases for the authenticated user.
 
     Parameters:
         page: Page number (1-based).
         page_size: Items per page.
+        cursor: Keyset cursor; when given, the page after it is returned without totals.
+        include_total: Whether to run the COUNT query for meta.total in page mode.
 
     Returns:
         Paginated[PurchaseRead]: Paginated list of purchases.
     """
-    page, page_size = sanitize_pagination(page, page_size)
-
-    total: int = int(db.scalar(select(func.count(Purchase.id)).where(Purchase.user_id == current_user.id)) or 0)
-
-    off, lim = offset_limit(page, page_size)
-    stmt = _query_user_purchases_base(current_user.id).order_by(Purchase.created_at.desc()).offset(off).limit(lim)
-    items: List[Purchase] = list(db.execute(stmt).scalars().all())
-
-    meta = PageMeta.build(total=total, page=page, page_size=page_size)
-    return Paginated[PurchaseRead](items=[PurchaseRead.model_validate(p) for p in items], meta=meta)
+    count_stmt = select(func.count(Purchase.id)).where(Purchase.user_id == current_user.id)
+    items, meta = fetch_page(
+        db,
+        _query_user_purchases_base(current_user.id),
+        model=Purchase,
+        sort_column=Purchase.created_at,
+        descending=True,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        count_stmt=count_stmt if include_total else None,
+    )
+    return orm_page_response(Paginated[PurchaseRead], _PURCHASE_LIST_ADAPTER, items, meta)
 
 
 # PUBLIC_INTERFACE
@@ -96,36 +109,35 @@ def create_purchase(
         HTTPException 404: Book not found.
         HTTPException 409: Purchase already exists for this user/book.
     """
-    book = db.get(Book, payload.book_id)
+    book = get_book_summary(db, payload.book_id)
     if not book:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
 
-    exists = db.scalar(
-        select(Purchase).where(Purchase.user_id == current_user.id, Purchase.book_id == payload.book_id)
+    stmt = (
+        dialect_insert(db, Purchase)
+        .values(
+            user_id=current_user.id,
+            book_id=payload.book_id,
+            price_cents=payload.price_cents,
+            currency=payload.currency,
+            transaction_id=payload.transaction_id,
+            status=payload.status,
+        )
+        .on_conflict_do_nothing(index_elements=[Purchase.user_id, Purchase.book_id])
+        .returning(Purchase)
     )
-    if exists:
+    purchase = db.scalars(stmt).first()
+    if purchase is None:
+        db.rollback()
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Book already purchased")
 
-    purchase = Purchase(
-        user_id=current_user.id,
-        book_id=payload.book_id,
-        price_cents=payload.price_cents,
-        currency=payload.currency,
-        transaction_id=payload.transaction_id,
-        status=payload.status,
+    # Ensure book is in user's library as a result of purchase, in the same transaction.
+    db.execute(
+        dialect_insert(db, Library)
+        .values(user_id=current_user.id, book_id=payload.book_id, source="purchase")
+        .on_conflict_do_nothing(index_elements=[Library.user_id, Library.book_id])
     )
-    db.add(purchase)
     db.commit()
-    db.refresh(purchase)
-
-    # Ensure book is in user's library as a result of purchase
-    lib_exists = db.scalar(
-        select(Library).where(Library.user_id == current_user.id, Library.book_id == payload.book_id)
-    )
-    if not lib_exists:
-        lib_entry = Library(user_id=current_user.id, book_id=payload.book_id, source="purchase")
-        db.add(lib_entry)
-        db.commit()
 
     return PurchaseRead.model_validate(purchase)
 
@@ -155,12 +167,7 @@ def get_purchase(
     Raises:
         HTTPException 404: If not found or not owned by user.
     """
-    stmt = (
-        select(Purchase)
-        .options(selectinload(Purchase.book), selectinload(Purchase.user))
-        .where(Purchase.id == purchase_id, Purchase.user_id == current_user.id)
-    )
-    purchase = db.execute(stmt).scalars().first()
+    purchase = db.scalars(_GET_PURCHASE_STMT, {"purchase_id": purchase_id, "user_id": current_user.id}).first()
     if not purchase:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Purchase not found")
     return PurchaseRead.model_validate(purchase)
@@ -1,23 +1,32 @@
 from __future__ import annotations
 
+import uuid
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from pydantic import BaseModel as PydBaseModel
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 from sqlalchemy import Select, func, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
+from src.db.dialect import dialect_insert
+from src.db.loading import get_book_summary, owned_row_stmt, summary_load_options
 from src.db.session import get_db
-from src.models.book import Book
 from src.models.reading_progress import ReadingProgress
 from src.models.user import User
 from src.schemas.reading_progress import ReadingProgressRead
 from src.services.auth_service import get_current_user
-from src.utils.pagination import PageMeta, Paginated, offset_limit, sanitize_pagination
+from src.utils.pagination import Paginated, fetch_page, orm_page_response
 
 router = APIRouter(prefix="/reading", tags=["Reading"])
 
+# Upsert fields that may be cleared with an explicit null; for the others null means "leave unchanged".
+_NULLABLE_PROGRESS_FIELDS = frozenset({"current_chapter", "current_location"})
+
+_PROGRESS_LIST_ADAPTER = TypeAdapter(List[ReadingProgressRead])
+
 
 class ReadingProgressUpsertRequest(PydBaseModel):
     """Payload for creating or updating reading progress for a specific book."""
@@ -27,16 +36,15 @@ class ReadingProgressUpsertRequest(PydBaseModel):
     is_completed: bool | None = Field(default=None, description="Mark as completed (true/false)")
 
 
+_PROGRESS_LOAD_OPTIONS = summary_load_options(ReadingProgress)
+
+
 def _query_user_progress_base(user_id: str) -> Select:
     """Build a base select for a user's reading progress with relationships preloaded."""
-    return (
-        select(ReadingProgress)
-        .options(
-            selectinload(ReadingProgress.book),
-            selectinload(ReadingProgress.user),
-        )
-        .where(ReadingProgress.user_id == user_id)
-    )
+    return select(ReadingProgress).options(*_PROGRESS_LOAD_OPTIONS).where(ReadingProgress.user_id == user_id)
+
+
+_GET_PROGRESS_STMT = owned_row_stmt(ReadingProgress, ReadingProgress.book_id, "book_id")
 
 
 # PUBLIC_INTERFACE
@@ -44,7 +52,11 @@ def _query_user_progress_base(user_id: str) -> Select:
     "",
     response_model=Paginated[ReadingProgressRead],
     summary="List reading progress",
-    description="List the authenticated user's reading progress with pagination. Optionally filter by completion status.",
+    description=(
+        "List the authenticated user's reading progress, most recently updated first. Optionally filter by "
+        "completion status. Supports page-based pagination and keyset pagination via the opaque `cursor` "
+        "returned in `meta.next_cursor`; set `include_total=false` to skip counting."
+    ),
 )
 def list_reading_progress(
     is_completed: Optional[bool] = Query(
@@ -52,9 +64,11 @@ def list_reading_progress(
     ),
     page: int = Query(default=1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(default=None, description="Keyset cursor from meta.next_cursor; overrides page"),
+    include_total: bool = Query(default=True, description="Count total items (ignored when paging by cursor)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> Paginated[ReadingProgressRead]:
+) -> Response:
     """
     List reading progress entries for the current user.
 
@@ -62,30 +76,31 @@ def list_reading_progress(
         is_completed: Optional filter by completion status.
         page: Page number (1-based).
         page_size: Items per page.
+        cursor: Keyset cursor; when given, the page after it is returned without totals.
+        include_total: Whether to run the COUNT query for meta.total in page mode.
 
     Returns:
         Paginated[ReadingProgressRead]
     """
-    page, page_size = sanitize_pagination(page, page_size)
-
     base = _query_user_progress_base(current_user.id)
-    count_stmt: Select
+    count_filters = [ReadingProgress.user_id == current_user.id]
     if is_completed is not None:
-        base = base.where(ReadingProgress.is_completed == bool(is_completed))
-        count_stmt = select(func.count(ReadingProgress.id)).where(
-            ReadingProgress.user_id == current_user.id, ReadingProgress.is_completed == bool(is_completed)
-        )
-    else:
-        count_stmt = select(func.count(ReadingProgress.id)).where(ReadingProgress.user_id == current_user.id)
-
-    total: int = int(db.scalar(count_stmt) or 0)
-
-    off, lim = offset_limit(page, page_size)
-    stmt = base.order_by(ReadingProgress.updated_at.desc()).offset(off).limit(lim)
-    items: List[ReadingProgress] = list(db.execute(stmt).scalars().all())
-
-    meta = PageMeta.build(total=total, page=page, page_size=page_size)
-    return Paginated[ReadingProgressRead](items=[ReadingProgressRead.model_validate(r) for r in items], meta=meta)
+        completed = ReadingProgress.is_completed == bool(is_completed)
+        base = base.where(completed)
+        count_filters.append(completed)
+
+    items, meta = fetch_page(
+        db,
+        base,
+        model=ReadingProgress,
+        sort_column=ReadingProgress.updated_at,
+        descending=True,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        count_stmt=select(func.count(ReadingProgress.id)).where(*count_filters) if include_total else None,
+    )
+    return orm_page_response(Paginated[ReadingProgressRead], _PROGRESS_LIST_ADAPTER, items, meta)
 
 
 # PUBLIC_INTERFACE
@@ -113,12 +128,7 @@ def get_progress_for_book(
     Raises:
         HTTPException 404: If no progress exists for this book/user.
     """
-    stmt = (
-        select(ReadingProgress)
-        .options(selectinload(ReadingProgress.book), selectinload(ReadingProgress.user))
-        .where(ReadingProgress.user_id == current_user.id, ReadingProgress.book_id == book_id)
-    )
-    progress = db.execute(stmt).scalars().first()
+    progress = db.scalars(_GET_PROGRESS_STMT, {"book_id": book_id, "user_id": current_user.id}).first()
     if not progress:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Reading progress not found")
     return ReadingProgressRead.model_validate(progress)
@@ -153,6 +163,7 @@ def upsert_progress_for_book(
     Behavior:
         - If a progress record exists, updates provided fields.
         - Otherwise, creates a new record with provided fields (unspecified fields use defaults).
+        - A null progress_percent or is_completed is treated as not provided.
 
     Returns:
         ReadingProgressRead
@@ -160,32 +171,37 @@ def upsert_progress_for_book(
     Raises:
         HTTPException 404: Book not found.
     """
-    # Validate book exists
-    book = db.get(Book, book_id)
-    if not book:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
-
-    # Check for existing progress
-    progress = db.scalar(
-        select(ReadingProgress).where(
-            ReadingProgress.user_id == current_user.id,
-            ReadingProgress.book_id == book_id,
+    data = {
+        field: value
+        for field, value in payload.model_dump(exclude_unset=True).items()
+        if value is not None or field in _NULLABLE_PROGRESS_FIELDS
+    }
+    if "progress_percent" in data:
+        # The column stores basis points; the Core insert bypasses the model's hybrid setter.
+        data["progress_percent_bp"] = round(data.pop("progress_percent") * 100)
+
+    # Insert-or-update in one statement. The id is generated here so that a returned row
+    # carrying it was inserted; a conflicting (user_id, book_id) row keeps its own id.
+    new_id = str(uuid.uuid4())
+    stmt = (
+        dialect_insert(db, ReadingProgress)
+        .values(id=new_id, user_id=current_user.id, book_id=book_id, **data)
+        .on_conflict_do_update(
+            index_elements=[ReadingProgress.user_id, ReadingProgress.book_id],
+            set_={**data, "updated_at": func.now()},
         )
+        .returning(ReadingProgress)
     )
-
-    created = False
-    if not progress:
-        progress = ReadingProgress(user_id=current_user.id, book_id=book_id)
-        created = True
-
-    data = payload.model_dump(exclude_unset=True)
-    for field, value in data.items():
-        setattr(progress, field, value)
-
-    db.add(progress)
+    try:
+        progress = db.scalars(stmt).one()
+    except IntegrityError:
+        # The books foreign key rejects unknown book ids.
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
     db.commit()
-    db.refresh(progress)
 
-    if created:
+    # Attach the book for the response; a plain lazy load would hydrate the whole row.
+    set_committed_value(progress, "book", get_book_summary(db, book_id))
+    if progress.id == new_id:
         response.status_code = status.HTTP_201_CREATED
     return ReadingProgressRead.model_validate(progress)
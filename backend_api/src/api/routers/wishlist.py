@@ -1,39 +1,41 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from pydantic import BaseModel as PydBaseModel
-from pydantic import Field
-from sqlalchemy import Select, func, select
-from sqlalchemy.orm import Session, selectinload
+from pydantic import Field, TypeAdapter
+from sqlalchemy import Select, delete, func, select
+from sqlalchemy.orm import Session
 
+from src.db.dialect import dialect_insert
+from src.db.loading import get_book_summary, owned_row_stmt, summary_load_options
 from src.db.session import get_db
-from src.models.book import Book
 from src.models.user import User
 from src.models.wishlist import Wishlist
 from src.schemas.wishlist import WishlistRead
 from src.services.auth_service import get_current_user
-from src.utils.pagination import PageMeta, Paginated, offset_limit, sanitize_pagination
+from src.utils.pagination import Paginated, fetch_page, orm_page_response
 
 router = APIRouter(prefix="/wishlist", tags=["Wishlist"])
 
+_WISHLIST_LIST_ADAPTER = TypeAdapter(List[WishlistRead])
+
 
 class WishlistAddRequest(PydBaseModel):
     """Request payload for adding a book to the current user's wishlist."""
     book_id: str = Field(..., description="Book ID to add to wishlist")
 
 
+_WISHLIST_LOAD_OPTIONS = summary_load_options(Wishlist)
+
+
 def _query_user_wishlist_base(user_id: str) -> Select:
     """Build a base select for a user's wishlist with relationships preloaded."""
-    return (
-        select(Wishlist)
-        .options(
-            selectinload(Wishlist.book),
-            selectinload(Wishlist.user),
-        )
-        .where(Wishlist.user_id == user_id)
-    )
+    return select(Wishlist).options(*_WISHLIST_LOAD_OPTIONS).where(Wishlist.user_id == user_id)
+
+
+_GET_WISHLIST_ENTRY_STMT = owned_row_stmt(Wishlist, Wishlist.id, "entry_id")
 
 
 # PUBLIC_INTERFACE
@@ -41,36 +43,44 @@ def _query_user_wishlist_base(user_id: str) -> Select:
     "",
     response_model=Paginated[WishlistRead],
     summary="List wishlist",
-    description="List the authenticated user's wishlist with pagination.",
+    description=(
+        "List the authenticated user's wishlist. Supports page-based pagination and keyset pagination via the "
+        "opaque `cursor` returned in `meta.next_cursor`; set `include_total=false` to skip counting."
+    ),
 )
 def list_wishlist(
     page: int = Query(default=1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(default=None, description="Keyset cursor from meta.next_cursor; overrides page"),
+    include_total: bool = Query(default=True, description="Count total items (ignored when paging by cursor)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> Paginated[WishlistRead]:
+) -> Response:
     """
     List wishlist entries for the authenticated user.
 
     Parameters:
         page: Page number (1-based).
         page_size: Items per page.
+        cursor: Keyset cursor; when given, the page after it is returned without totals.
+        include_total: Whether to run the COUNT query for meta.total in page mode.
 
     Returns:
         Paginated[WishlistRead]: Paginated list of wishlist entries.
     """
-    page, page_size = sanitize_pagination(page, page_size)
-
-    # Count total
-    total: int = int(db.scalar(select(func.count(Wishlist.id)).where(Wishlist.user_id == current_user.id)) or 0)
-
-    # Fetch page
-    off, lim = offset_limit(page, page_size)
-    stmt = _query_user_wishlist_base(current_user.id).order_by(Wishlist.created_at.desc()).offset(off).limit(lim)
-    items: List[Wishlist] = list(db.execute(stmt).scalars().all())
-
-    meta = PageMeta.build(total=total, page=page, page_size=page_size)
-    return Paginated[WishlistRead](items=[WishlistRead.model_validate(w) for w in items], meta=meta)
+    count_stmt = select(func.count(Wishlist.id)).where(Wishlist.user_id == current_user.id)
+    items, meta = fetch_page(
+        db,
+        _query_user_wishlist_base(current_user.id),
+        model=Wishlist,
+        sort_column=Wishlist.created_at,
+        descending=True,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        count_stmt=count_stmt if include_total else None,
+    )
+    return orm_page_response(Paginated[WishlistRead], _WISHLIST_LIST_ADAPTER, items, meta)
 
 
 # PUBLIC_INTERFACE
@@ -104,20 +114,21 @@ def add_to_wishlist(
         HTTPException 404: Book not found.
         HTTPException 409: Already exists in wishlist.
     """
-    book = db.get(Book, payload.book_id)
+    book = get_book_summary(db, payload.book_id)
     if not book:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
 
-    exists = db.scalar(
-        select(Wishlist).where(Wishlist.user_id == current_user.id, Wishlist.book_id == payload.book_id)
+    stmt = (
+        dialect_insert(db, Wishlist)
+        .values(user_id=current_user.id, book_id=payload.book_id)
+        .on_conflict_do_nothing(index_elements=[Wishlist.user_id, Wishlist.book_id])
+        .returning(Wishlist)
     )
-    if exists:
+    entry = db.scalars(stmt).first()
+    if entry is None:
+        db.rollback()
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Book already in wishlist")
-
-    entry = Wishlist(user_id=current_user.id, book_id=payload.book_id)
-    db.add(entry)
     db.commit()
-    db.refresh(entry)
     return WishlistRead.model_validate(entry)
 
 
@@ -146,12 +157,7 @@ def get_wishlist_entry(
     Raises:
         HTTPException 404: If not found or not owned by the user.
     """
-    stmt = (
-        select(Wishlist)
-        .options(selectinload(Wishlist.book), selectinload(Wishlist.user))
-        .where(Wishlist.id == entry_id, Wishlist.user_id == current_user.id)
-    )
-    entry = db.execute(stmt).scalars().first()
+    entry = db.scalars(_GET_WISHLIST_ENTRY_STMT, {"entry_id": entry_id, "user_id": current_user.id}).first()
     if not entry:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Wishlist entry not found")
     return WishlistRead.model_validate(entry)
@@ -182,9 +188,12 @@ def remove_from_wishlist(
     Raises:
         HTTPException 404: If not found or not owned by the user.
     """
-    entry = db.get(Wishlist, entry_id)
-    if not entry or entry.user_id != current_user.id:
+    # Ownership check and delete in one statement; no row returned means not found or not owned.
+    deleted_id = db.execute(
+        delete(Wishlist).where(Wishlist.id == entry_id, Wishlist.user_id == current_user.id).returning(Wishlist.id)
+    ).scalar_one_or_none()
+    if deleted_id is None:
+        db.rollback()
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Wishlist entry not found")
-    db.delete(entry)
     db.commit()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
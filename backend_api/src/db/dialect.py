@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+# PUBLIC_INTERFACE
+def dialect_insert(db: Session, entity: Any) -> Any:
+    """
+    Return an INSERT construct for the session's database dialect.
+
+    The PostgreSQL and SQLite inserts both support ON CONFLICT clauses
+    (on_conflict_do_nothing / on_conflict_do_update) and RETURNING, letting
+    "insert unless present" writes run as a single statement. With
+    on_conflict_do_nothing().returning(...), a conflicting row returns nothing, so an
+    empty result is the duplicate signal and no separate existence query is needed.
+
+    Parameters:
+        db: Session whose bound engine determines the dialect.
+        entity: ORM model class or Table to insert into.
+
+    Returns:
+        A dialect-specific Insert construct.
+
+    Raises:
+        NotImplementedError: For dialects without ON CONFLICT support.
+    """
+    name = db.get_bind().dialect.name
+    if name == "postgresql":
+        return postgresql.insert(entity)
+    if name == "sqlite":
+        return sqlite.insert(entity)
+    raise NotImplementedError(f"ON CONFLICT inserts are not supported for dialect {name!r}")
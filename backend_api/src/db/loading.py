@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import Select, bindparam, select
+from sqlalchemy.orm import Session, joinedload, load_only, raiseload
+
+from src.models.book import Book
+
+
+# PUBLIC_INTERFACE
+def summary_load_options(model: Any) -> Tuple[Any, ...]:
+    """
+    Loader options for listing a user's rows that render their book as a BookSummary.
+
+    The book is loaded in the same query through an inner join (book_id is a non-null FK),
+    fetching only the columns BookSummary renders. model.user is the authenticated user,
+    already in the session's identity map, so its many-to-one load resolves without SQL;
+    any relationship that would need a query raises instead of causing N+1 lookups.
+
+    Parameters:
+        model: ORM model with a non-null many-to-one `book` relationship.
+
+    Returns:
+        Options to pass to Select.options().
+    """
+    return (
+        joinedload(model.book, innerjoin=True).load_only(Book.title, Book.author).raiseload("*"),
+        raiseload("*", sql_only=True),
+    )
+
+
+# PUBLIC_INTERFACE
+def get_book_summary(db: Session, book_id: str) -> Optional[Book]:
+    """
+    Load a book with only the columns BookSummary renders.
+
+    Write endpoints use this both as the existence check and to put the book in the
+    identity map, so the row they return renders its book without another query.
+
+    Parameters:
+        db: Session to load into.
+        book_id: Book ID.
+
+    Returns:
+        The Book, or None if it does not exist.
+    """
+    return db.get(Book, book_id, options=[load_only(Book.title, Book.author), raiseload("*")])
+
+
+# PUBLIC_INTERFACE
+def owned_row_stmt(model: Any, key_column: Any, key_param: str) -> Select:
+    """
+    Select one of a user's rows by key, with summary_load_options applied.
+
+    Routers build these once at import: the key and the owning user are bind parameters
+    (key_param and "user_id"), so only the bound values vary per request.
+
+    Parameters:
+        model: ORM model with user_id and a non-null many-to-one `book` relationship.
+        key_column: Column matched against the key_param bind parameter.
+        key_param: Name of the key's bind parameter.
+
+    Returns:
+        The Select, to execute with {key_param: ..., "user_id": ...}.
+    """
+    return (
+        select(model)
+        .options(*summary_load_options(model))
+        .where(key_column == bindparam(key_param), model.user_id == bindparam("user_id"))
+    )
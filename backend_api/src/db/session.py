@@ -1,14 +1,29 @@
 from __future__ import annotations
 
-import re
+import logging
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Iterator
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import Session, sessionmaker
 
-from src.core.config import BASE_DIR, get_settings
+from src.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Applied to every new SQLite connection. WAL lets readers run alongside a writer and, with
+# synchronous=NORMAL, commits skip the per-transaction fsync of the rollback journal.
+# foreign_keys enables the ON DELETE CASCADE / FK checks SQLite otherwise ignores.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=134217728",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA foreign_keys=ON",
+)
 
 
 def _ensure_sqlite_dir(url: str) -> None:
@@ -17,37 +32,44 @@ def _ensure_sqlite_dir(url: str) -> None:
 
     This is a safe no-op for non-SQLite URLs or in-memory SQLite DBs.
     """
-    if not url.startswith("sqlite"):
-        return
-
-    # Skip in-memory DB
-    if ":memory:" in url:
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite":
         return
 
-    # Extract path after sqlite:///
-    # Supports "sqlite:///relative/path.db" or absolute "sqlite:////abs/path.db"
-    m = re.match(r"^sqlite:(?://)?/(.*)$", url)
-    if not m:
+    # "sqlite://" and "sqlite:///:memory:" are in-memory databases
+    database = parsed.database
+    if not database or database == ":memory:":
         return
 
-    db_path_str = m.group(1)
-    # Handle possible extra leading slash for absolute paths
-    db_path = Path("/" + db_path_str).resolve() if db_path_str.startswith("/") else Path(db_path_str).resolve()
-
-    # If the path is relative (e.g., ./data/app.db), make it relative to backend_api root
-    if not db_path.is_absolute():
-        db_path = (BASE_DIR / db_path).resolve()
-
-    db_path.parent.mkdir(parents=True, exist_ok=True)
+    # Relative paths resolve against the working directory, as SQLite itself opens them
+    Path(database).parent.mkdir(parents=True, exist_ok=True)
 
 
 def _create_engine() -> Engine:
     settings = get_settings()
+    pool_options = {}
     if settings.is_sqlite:
         _ensure_sqlite_dir(settings.database_url)
-        connect_args = {"check_same_thread": False}
+        # timeout: wait up to 30s for a competing writer's lock instead of failing with "database is locked".
+        connect_args = {"check_same_thread": False, "timeout": 30}
     else:
         connect_args = {}
+        # Size the QueuePool for concurrent request handling; LIFO keeps a small hot
+        # set of connections so idle ones can be recycled by the server.
+        pool_options = {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+            "pool_recycle": settings.db_pool_recycle,
+            "pool_use_lifo": True,
+        }
+        logger.info(
+            "Database pool: size=%d max_overflow=%d timeout=%ds recycle=%ds",
+            settings.db_pool_size,
+            settings.db_max_overflow,
+            settings.db_pool_timeout,
+            settings.db_pool_recycle,
+        )
 
     # Use pool_pre_ping to gracefully handle stale connections
     engine = create_engine(
@@ -55,13 +77,27 @@ def _create_engine() -> Engine:
         future=True,
         pool_pre_ping=True,
         connect_args=connect_args,
+        **pool_options,
     )
+    if settings.is_sqlite:
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
     return engine
 
 
-# Engine and Session factory are module-level singletons
+def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    """Configure a freshly opened SQLite connection (see _SQLITE_PRAGMAS)."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+# Engine and Session factory are module-level singletons. Objects are not expired on commit:
+# handlers serialize what they just wrote, and server defaults already come back via RETURNING.
 ENGINE: Engine = _create_engine()
-SessionLocal = sessionmaker(bind=ENGINE, autoflush=False, autocommit=False, future=True)
+SessionLocal = sessionmaker(bind=ENGINE, autoflush=False, autocommit=False, expire_on_commit=False, future=True)
 
 
 # PUBLIC_INTERFACE
@@ -72,11 +108,24 @@ def get_db() -> Generator[Session, None, None]:
     Yields:
         A SQLAlchemy Session bound to the application engine.
     Ensures:
-        The session is closed after request processing to avoid leaks.
+        The session is closed after request processing to avoid leaks; closing rolls
+        back any transaction the handler left uncommitted.
     """
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
+        yield db
+
+
+# PUBLIC_INTERFACE
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    Transactional session scope for work outside request handlers (scripts, jobs).
+
+    Yields:
+        A SQLAlchemy Session inside a transaction.
+    Ensures:
+        The transaction is committed on success or rolled back on error, and the
+        session is closed afterwards.
+    """
+    with SessionLocal() as db, db.begin():
         yield db
-    finally:
-        # Ensure proper cleanup
-        db.close()
@@ -33,5 +33,9 @@ class BaseModel(Base, IDMixin, TimestampMixin):
     Includes:
     - UUID primary key 'id'
     - created_at and updated_at timestamps
+
+    Server-generated timestamps are fetched with RETURNING as part of each INSERT/UPDATE
+    (eager_defaults), so freshly written rows can be serialized without a refresh SELECT.
     """
     __abstract__ = True
+    __mapper_args__ = {"eager_defaults": True}
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import Date, Float, Integer, String, Text
+from sqlalchemy import Date, Float, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import BaseModel
@@ -44,16 +44,48 @@ class Book(BaseModel):
     """
 
     __tablename__ = "books"
+    __table_args__ = (
+        # Matches the list ordering (created_at DESC, id DESC) used for keyset pagination.
+        Index("ix_books_created_at_id", "created_at", "id"),
+        # PostgreSQL only: lets the BookSummary joins from user lists (id, title, author) be
+        # answered from the index without visiting the heap. The primary key serves SQLite.
+        Index("ix_books_id_summary", "id", postgresql_include=["title", "author"]).ddl_if(dialect="postgresql"),
+        # Trigram GIN indexes serve ILIKE '%q%' searches on PostgreSQL (pg_trgm).
+        Index(
+            "ix_books_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_books_author_trgm", "author", postgresql_using="gin", postgresql_ops={"author": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_books_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
-    title: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
-    author: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
-    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Searched only with ILIKE '%q%', which the trigram indexes above serve and a btree cannot.
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    author: Mapped[str] = mapped_column(String(255), nullable=False)
+    # The long text and URL columns are only rendered by full BookRead responses, so they are
+    # left out of Book loads unless the query undefers their group ("body" / "media").
+    # Touching them when not loaded raises rather than issuing a per-row SELECT.
+    description: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="body", deferred_raiseload=True
+    )
 
-    cover_image_url: Mapped[str | None] = mapped_column(String(512), nullable=True)
-    file_url: Mapped[str | None] = mapped_column(String(512), nullable=True)
-    sample_file_url: Mapped[str | None] = mapped_column(String(512), nullable=True)
+    cover_image_url: Mapped[str | None] = mapped_column(
+        String(512), nullable=True, deferred=True, deferred_group="media", deferred_raiseload=True
+    )
+    file_url: Mapped[str | None] = mapped_column(
+        String(512), nullable=True, deferred=True, deferred_group="media", deferred_raiseload=True
+    )
+    sample_file_url: Mapped[str | None] = mapped_column(
+        String(512), nullable=True, deferred=True, deferred_group="media", deferred_raiseload=True
+    )
 
-    price_cents: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    price_cents: Mapped[int] = mapped_column(Integer, nullable=False, default=0, index=True)
     currency: Mapped[str] = mapped_column(String(8), nullable=False, default="USD")
 
     published_date: Mapped["Date | None"] = mapped_column(Date, nullable=True)
@@ -62,12 +94,15 @@ class Book(BaseModel):
     page_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
     rating: Mapped[float | None] = mapped_column(Float, nullable=True)
 
-    # Many-to-many relation with Category
+    # Many-to-many relation with Category. Never loaded implicitly: the books router fills it
+    # with _load_categories(), one query per page, and set_committed_value. Association rows
+    # are removed by the ON DELETE CASCADE foreign key, so deletes need not load the collection.
     categories: Mapped[list["Category"]] = relationship(
         "Category",
         secondary=book_category_association,
         back_populates="books",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     # One-to-many relations with user interactions
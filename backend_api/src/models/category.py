@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import BaseModel
@@ -25,14 +25,27 @@ class Category(BaseModel):
     """
 
     __tablename__ = "categories"
+    __table_args__ = (
+        # Matches the list ordering (name, id) used for keyset pagination.
+        Index("ix_categories_name_id", "name", "id"),
+        # Trigram GIN indexes serve ILIKE '%q%' searches on PostgreSQL (pg_trgm).
+        Index(
+            "ix_categories_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_categories_slug_trgm", "slug", postgresql_using="gin", postgresql_ops={"slug": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
 
-    name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
     slug: Mapped[str] = mapped_column(String(120), nullable=False, unique=True, index=True)
 
-    # Many-to-many relationship with Book
+    # Many-to-many relationship with Book; never loaded implicitly. The reverse side,
+    # Book.categories, is filled by the books router's _load_categories() with set_committed_value.
     books: Mapped[list["Book"]] = relationship(
         "Book",
         secondary=book_category_association,
         back_populates="categories",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, String, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import BaseModel
@@ -30,10 +30,21 @@ class Library(BaseModel):
     """
 
     __tablename__ = "libraries"
-    __table_args__ = (UniqueConstraint("user_id", "book_id", name="uq_libraries_user_id_book_id"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "book_id", name="uq_libraries_user_id_book_id"),
+        # Matches the per-user list ordering (created_at DESC, id DESC) used for keyset pagination;
+        # on PostgreSQL it also includes every other selected column for index-only scans.
+        Index(
+            "ix_libraries_user_id_created_at_id",
+            "user_id",
+            "created_at",
+            "id",
+            postgresql_include=["book_id", "source", "updated_at"],
+        ),
+    )
 
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     book_id: Mapped[str] = mapped_column(
         String(36), ForeignKey("books.id", ondelete="CASCADE"), nullable=False, index=True
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from sqlalchemy import Boolean, Float, ForeignKey, String, UniqueConstraint
+from sqlalchemy import Boolean, CheckConstraint, ForeignKey, Index, SmallInteger, String, UniqueConstraint, text
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import BaseModel
@@ -19,13 +20,15 @@ class ReadingProgress(BaseModel):
         id (str): UUID primary key.
         user_id (str): FK to users.id.
         book_id (str): FK to books.id.
-        progress_percent (float): 0.0 to 100.0 progress percentage.
+        progress_percent_bp (int): Progress in basis points, 0 to 10000.
+        progress_percent (float): 0.0 to 100.0 progress percentage (derived from progress_percent_bp).
         current_chapter (str | None): Current chapter identifier.
         current_location (str | None): Current location/position marker within the book.
         is_completed (bool): Whether the book was finished by the user.
 
     Constraints:
         Unique (user_id, book_id): One progress record per user-book pair.
+        Check progress_percent_bp BETWEEN 0 AND 10000: Progress stays within 0-100%.
 
     Relationships:
         user: The reader.
@@ -33,19 +36,49 @@ class ReadingProgress(BaseModel):
     """
 
     __tablename__ = "reading_progress"
-    __table_args__ = (UniqueConstraint("user_id", "book_id", name="uq_reading_progress_user_id_book_id"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "book_id", name="uq_reading_progress_user_id_book_id"),
+        CheckConstraint("progress_percent_bp BETWEEN 0 AND 10000", name="progress_percent_bp_range"),
+        # Matches the per-user list ordering (updated_at DESC, id DESC) used for keyset pagination.
+        Index("ix_reading_progress_user_id_updated_at_id", "user_id", "updated_at", "id"),
+        # Partial index: the "currently reading" list (is_completed=false) only walks unfinished rows.
+        Index(
+            "ix_reading_progress_in_progress",
+            "user_id",
+            "updated_at",
+            "id",
+            postgresql_where=text("NOT is_completed"),
+            sqlite_where=text("is_completed = 0"),
+        ),
+    )
 
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     book_id: Mapped[str] = mapped_column(
         String(36), ForeignKey("books.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
-    progress_percent: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    # Stored as hundredths of a percent in a 2-byte integer rather than an 8-byte float;
+    # two decimals is all the precision progress needs and integers compare exactly.
+    progress_percent_bp: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
     current_chapter: Mapped[str | None] = mapped_column(String(255), nullable=True)
     current_location: Mapped[str | None] = mapped_column(String(255), nullable=True)
     is_completed: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
+    @hybrid_property
+    def progress_percent(self) -> float:
+        """Progress as a 0.0 to 100.0 percentage."""
+        return self.progress_percent_bp / 100
+
+    @progress_percent.inplace.setter
+    def _progress_percent_setter(self, value: float) -> None:
+        self.progress_percent_bp = round(value * 100)
+
+    @progress_percent.inplace.expression
+    @classmethod
+    def _progress_percent_expression(cls):
+        return cls.progress_percent_bp / 100.0
+
     user: Mapped["User"] = relationship("User", back_populates="reading_progress")
     book: Mapped["Book"] = relationship("Book", back_populates="reading_progress_entries")
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+from typing import Annotated
+
 from pydantic import BaseModel as PydBaseModel
-from pydantic import ConfigDict, EmailStr, Field
+from pydantic import ConfigDict, EmailStr, Field, StringConstraints
 
 from src.schemas.base import IDSchema, TimestampedSchema
 
+# Emails returned by the API were validated as EmailStr when they were stored, so response
+# schemas only check the shape with a pattern pydantic-core matches natively; EmailStr would
+# run email-validator in Python for every user embedded in a list page.
+_StoredEmail = Annotated[str, StringConstraints(pattern=r"^[^@\s]+@[^@\s]+$", max_length=320)]
+
 
 class UserBase(PydBaseModel):
     """Shared properties for User entities (excludes password hash)."""
@@ -32,12 +39,12 @@ class UserUpdate(PydBaseModel):
 
 class UserRead(IDSchema, TimestampedSchema, UserBase):
     """Representation of a user returned by the API."""
-    pass
+    email: _StoredEmail = Field(..., description="Unique email address")
 
 
 class UserSummary(IDSchema):
     """Lightweight representation for embedding inside related models."""
-    email: EmailStr
+    email: _StoredEmail
     full_name: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
@@ -1,37 +1,55 @@
 from __future__ import annotations
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional, Tuple
 
+import bcrypt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+import jwt
+from sqlalchemy.orm import Session, load_only
 
 from src.core.config import get_settings, Settings
 from src.db.session import get_db
 from src.models.user import User
 
-# Password hashing context
-_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt work factor (2^12 rounds, the same cost passlib used) and the input length it
+# considers; longer passwords are truncated, as passlib did, rather than rejected.
+_BCRYPT_ROUNDS = 12
+_BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# Settings are loaded once per process (get_settings is cached); resolving them here keeps the
+# lookup off every token operation and out of get_current_user's dependency graph.
+_settings: Settings = get_settings()
 
 # OAuth2 scheme declaration (used by dependencies if needed)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+# Verified token claims, keyed by a digest of (secret, algorithm, token) so raw tokens
+# are never kept in memory. Entries are dropped once the token's own "exp" has passed.
+_TOKEN_CACHE_MAXSIZE = 1024
+_token_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
 
 # PUBLIC_INTERFACE
 def get_password_hash(password: str) -> str:
-    """Hash a plaintext password using bcrypt via passlib."""
-    return _pwd_context.hash(password)
+    """Hash a plaintext password using bcrypt."""
+    secret = password.encode("utf-8")[:_BCRYPT_MAX_PASSWORD_BYTES]
+    return bcrypt.hashpw(secret, bcrypt.gensalt(rounds=_BCRYPT_ROUNDS)).decode("ascii")
 
 
 # PUBLIC_INTERFACE
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plaintext password against its hashed value."""
     try:
-        return _pwd_context.verify(plain_password, hashed_password)
+        secret = plain_password.encode("utf-8")[:_BCRYPT_MAX_PASSWORD_BYTES]
+        return bcrypt.checkpw(secret, hashed_password.encode("ascii"))
     except Exception:
         # Intentionally avoid leaking details
         return False
@@ -46,8 +64,7 @@ def _create_token(
     extra_claims: Optional[Dict[str, Any]] = None,
 ) -> str:
     """Create a JWT token with the given subject and expiry."""
-    if settings is None:
-        settings = get_settings()
+    settings = settings or _settings
 
     now = datetime.now(tz=timezone.utc)
     expire = now + timedelta(minutes=expires_minutes)
@@ -62,7 +79,7 @@ def _create_token(
 
     token = jwt.encode(
         payload,
-        settings.secret_key,
+        _jwt_key(settings.secret_key),
         algorithm=settings.jwt_algorithm,
     )
     return token
@@ -71,8 +88,7 @@ def _create_token(
 # PUBLIC_INTERFACE
 def create_access_token(subject: str, *, settings: Optional[Settings] = None, extra_claims: Optional[Dict[str, Any]] = None) -> str:
     """Create a short-lived access token."""
-    if settings is None:
-        settings = get_settings()
+    settings = settings or _settings
     return _create_token(
         subject,
         expires_minutes=settings.access_token_expire_minutes,
@@ -85,8 +101,7 @@ def create_access_token(subject: str, *, settings: Optional[Settings] = None, ex
 # PUBLIC_INTERFACE
 def create_refresh_token(subject: str, *, settings: Optional[Settings] = None, extra_claims: Optional[Dict[str, Any]] = None) -> str:
     """Create a long-lived refresh token."""
-    if settings is None:
-        settings = get_settings()
+    settings = settings or _settings
     return _create_token(
         subject,
         expires_minutes=settings.refresh_token_expire_minutes,
@@ -99,23 +114,76 @@ def create_refresh_token(subject: str, *, settings: Optional[Settings] = None, e
 # PUBLIC_INTERFACE
 def create_token_pair_for_user(user: User, *, settings: Optional[Settings] = None) -> Tuple[str, str]:
     """Create an access and refresh token pair for a given user."""
-    if settings is None:
-        settings = get_settings()
+    settings = settings or _settings
     access = create_access_token(user.id, settings=settings, extra_claims={"email": user.email})
     refresh = create_refresh_token(user.id, settings=settings)
     return access, refresh
 
 
+@lru_cache(maxsize=4)
+def _jwt_key(secret_key: str) -> bytes:
+    """Encode the HMAC signing key once rather than on every sign/verify call."""
+    return secret_key.encode("utf-8")
+
+
+def _token_cache_key(token: str, settings: Settings) -> bytes:
+    """Digest identifying a token under the current signing configuration."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in (settings.secret_key, settings.jwt_algorithm, token):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.digest()
+
+
+def _cached_claims(key: bytes) -> Optional[Dict[str, Any]]:
+    """Return a copy of cached claims for key if present and not yet expired."""
+    with _token_cache_lock:
+        claims = _token_cache.get(key)
+        if claims is None:
+            return None
+        exp = claims.get("exp")
+        if not isinstance(exp, (int, float)) or exp <= time.time():
+            del _token_cache[key]
+            return None
+        _token_cache.move_to_end(key)
+        return dict(claims)
+
+
+def _store_claims(key: bytes, claims: Dict[str, Any]) -> None:
+    """Remember verified claims, evicting the least recently used entry when full."""
+    if not isinstance(claims.get("exp"), (int, float)):
+        # Only tokens with an expiry are cacheable; the cache must never outlive them.
+        return
+    with _token_cache_lock:
+        _token_cache[key] = dict(claims)
+        _token_cache.move_to_end(key)
+        while len(_token_cache) > _TOKEN_CACHE_MAXSIZE:
+            _token_cache.popitem(last=False)
+
+
 # PUBLIC_INTERFACE
 def decode_token(token: str, *, settings: Optional[Settings] = None) -> Dict[str, Any]:
-    """Decode and validate a JWT token, returning the payload if valid."""
-    if settings is None:
-        settings = get_settings()
+    """Decode and validate a JWT token, returning the payload if valid.
+
+    Successfully verified payloads are cached until the token expires, so repeated
+    requests carrying the same bearer token skip signature verification.
+    """
+    settings = settings or _settings
+    key = _token_cache_key(token, settings)
+    cached = _cached_claims(key)
+    if cached is not None:
+        return cached
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.jwt_algorithm])
-        return payload
-    except JWTError as e:
+        payload = jwt.decode(
+            token,
+            _jwt_key(settings.secret_key),
+            algorithms=[settings.jwt_algorithm],
+            options={"require": ["exp", "sub", "type"]},
+        )
+    except jwt.PyJWTError as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token") from e
+    _store_claims(key, payload)
+    return payload
 
 
 # PUBLIC_INTERFACE
@@ -131,15 +199,16 @@ def get_token_payload(token: str, *, expected_type: Optional[str] = None, settin
 def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db),
-    settings: Settings = Depends(get_settings),
 ) -> User:
     """FastAPI dependency that resolves the current authenticated user from a bearer token."""
-    payload = get_token_payload(token, expected_type="access", settings=settings)
+    payload = get_token_payload(token, expected_type="access")
     user_id = payload.get("sub")
     if not user_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token subject")
 
-    user = db.scalar(select(User).where(User.id == user_id))
+    # Only the columns needed for the auth decision and embedded user summaries; other
+    # attributes load on first access should an endpoint ever need them.
+    user = db.get(User, user_id, options=[load_only(User.id, User.email, User.full_name, User.is_active)])
     if not user or not user.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Inactive or missing user")
     return user
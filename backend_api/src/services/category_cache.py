@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from src.models.category import Category
+
+
+_CATEGORY_ID_TTL_SECONDS = 300
+_CATEGORY_ID_CACHE_SIZE = 1024
+
+# Category id keyed by slug, with its absolute expiry (monotonic). Only hits are cached, so
+# a newly created category is visible immediately; updates and deletes made through this
+# process clear the cache, and the TTL bounds staleness from changes made by other workers.
+_category_ids: Dict[str, Tuple[str, float]] = {}
+_category_ids_lock = threading.Lock()
+
+
+# PUBLIC_INTERFACE
+def get_category_id_by_slug(db: Session, slug: str) -> Optional[str]:
+    """Resolve a category slug to its id, consulting the in-process cache first.
+
+    Args:
+        db: Session used to look the slug up on a cache miss.
+        slug: Category slug.
+
+    Returns:
+        str | None: The category id, or None if no category has this slug.
+    """
+    now = time.monotonic()
+    with _category_ids_lock:
+        hit = _category_ids.get(slug)
+    if hit is not None and now < hit[1]:
+        return hit[0]
+
+    category_id = db.scalar(select(Category.id).where(Category.slug == slug))
+    if category_id is not None:
+        with _category_ids_lock:
+            if slug not in _category_ids and len(_category_ids) >= _CATEGORY_ID_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order).
+                _category_ids.pop(next(iter(_category_ids)))
+            _category_ids[slug] = (category_id, now + _CATEGORY_ID_TTL_SECONDS)
+    return category_id
+
+
+# PUBLIC_INTERFACE
+def invalidate_category_cache() -> None:
+    """Drop every cached slug -> id mapping."""
+    with _category_ids_lock:
+        _category_ids.clear()
+
+
+@event.listens_for(Category, "after_update")
+@event.listens_for(Category, "after_delete")
+def _invalidate_on_change(mapper, connection, target) -> None:
+    # A renamed slug's old key is no longer known here, so clear everything; categories
+    # change rarely enough that refilling the cache is cheap.
+    invalidate_category_cache()
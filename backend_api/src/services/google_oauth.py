@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import json
+import re
 import secrets
+import threading
+import time
 from typing import Any, Dict, Tuple
 
-from google.oauth2 import id_token as google_id_token
-from google.auth.transport import requests as google_requests
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -12,10 +14,51 @@ from src.models.user import User
 from src.services.auth_service import get_password_hash
 
 
+_GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+_GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+# Used when Google's certs response carries no usable Cache-Control max-age.
+_DEFAULT_CERTS_TTL_SECONDS = 3600
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+# Google's signing certificates keyed by "kid", with their absolute expiry (monotonic).
+_certs: Dict[str, str] = {}
+_certs_expires_at = 0.0
+_certs_lock = threading.Lock()
+
+
+def _fetch_google_certs() -> Tuple[Dict[str, str], float]:
+    """Download Google's public certificates and compute how long they may be cached."""
+    # Imported lazily: google-auth pulls in requests/urllib3, which only the Google
+    # sign-in endpoint needs, so keep it off the application start-up path.
+    from google.auth.transport import requests as google_requests
+
+    response = google_requests.Request()(_GOOGLE_CERTS_URL, method="GET")
+    if response.status != 200:
+        raise ValueError(f"Could not fetch Google certificates (HTTP {response.status})")
+    certs = json.loads(response.data)
+    match = _MAX_AGE_RE.search(response.headers.get("cache-control", "") or "")
+    ttl = int(match.group(1)) if match else _DEFAULT_CERTS_TTL_SECONDS
+    return certs, time.monotonic() + ttl
+
+
+def _get_google_certs(kid: str | None) -> Dict[str, str]:
+    """Return cached Google certificates, refetching when expired or when kid is unknown."""
+    global _certs, _certs_expires_at
+    with _certs_lock:
+        fresh = time.monotonic() < _certs_expires_at
+        if fresh and (kid is None or kid in _certs):
+            return _certs
+        _certs, _certs_expires_at = _fetch_google_certs()
+        return _certs
+
+
 # PUBLIC_INTERFACE
 def verify_google_id_token(id_token: str, audience: str) -> Dict[str, Any]:
     """Verify a Google ID token and return its claims if valid.
 
+    Google's signing certificates are cached for the lifetime advertised by their
+    Cache-Control header and only refetched early when a token uses an unknown key id.
+
     Args:
         id_token: Google ID token obtained on the client.
         audience: Expected Google OAuth Client ID (configured in environment).
@@ -26,8 +69,13 @@ def verify_google_id_token(id_token: str, audience: str) -> Dict[str, Any]:
     Raises:
         ValueError: If token verification fails.
     """
-    request = google_requests.Request()
-    claims = google_id_token.verify_oauth2_token(id_token, request, audience=audience)
+    from google.auth import jwt as google_jwt
+
+    kid = google_jwt.decode_header(id_token).get("kid")
+    certs = _get_google_certs(kid)
+    claims = google_jwt.decode(id_token, certs=certs, audience=audience)
+    if claims.get("iss") not in _GOOGLE_ISSUERS:
+        raise ValueError(f"Wrong issuer: {claims.get('iss')!r}")
     return dict(claims)
 
 
@@ -70,9 +118,8 @@ def get_or_create_user_from_google(db: Session, claims: Dict[str, Any]) -> User:
             user.avatar_url = picture
             updated = True
         if updated:
-            db.add(user)
+            # updated_at comes back through RETURNING (eager_defaults); no refresh SELECT needed.
             db.commit()
-            db.refresh(user)
         return user
 
     # Create a new user with a securely generated random password
@@ -87,5 +134,4 @@ def get_or_create_user_from_google(db: Session, claims: Dict[str, Any]) -> User:
     )
     db.add(user)
     db.commit()
-    db.refresh(user)
     return user
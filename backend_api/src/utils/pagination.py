@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-from math import ceil
-from typing import Generic, List, Tuple, TypeVar
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Sequence, Tuple, Type, TypeVar
 
+from fastapi import HTTPException, Response, status
 from pydantic import BaseModel as PydBaseModel
-from pydantic import Field
+from pydantic import Field, TypeAdapter
+from sqlalchemy import ColumnElement, DateTime, Select, String, and_, func, literal, or_, type_coerce
+from sqlalchemy.orm import Session
 
 T = TypeVar("T")
 
@@ -12,25 +18,46 @@ DEFAULT_PAGE_SIZE = 20
 MAX_PAGE_SIZE = 100
 
 
+def _clamp(page: int | None, page_size: int | None) -> Tuple[int, int]:
+    """Clamp page to >= 1 and page_size to [1, MAX_PAGE_SIZE], defaulting a missing or non-positive size."""
+    page = max(1, int(page or 1))
+    size = int(page_size or DEFAULT_PAGE_SIZE)
+    if size < 1:
+        size = DEFAULT_PAGE_SIZE
+    elif size > MAX_PAGE_SIZE:
+        size = MAX_PAGE_SIZE
+    return page, size
+
+
 class PageMeta(PydBaseModel):
     """Pagination metadata for list endpoints."""
     page: int = Field(..., ge=1, description="Current page number (1-based)")
     page_size: int = Field(..., ge=1, description="Number of items per page")
-    total: int = Field(..., ge=0, description="Total number of items available")
-    total_pages: int = Field(..., ge=1, description="Total number of pages")
+    total: Optional[int] = Field(
+        default=None, ge=0, description="Total number of items available (null when paging by cursor or include_total=false)"
+    )
+    total_pages: Optional[int] = Field(
+        default=None, ge=1, description="Total number of pages (null whenever total is null)"
+    )
+    next_cursor: Optional[str] = Field(
+        default=None, description="Opaque cursor for the next page; null on the last page"
+    )
 
     @staticmethod
     # PUBLIC_INTERFACE
-    def build(total: int, page: int, page_size: int) -> "PageMeta":
-        """Build a PageMeta given total, page and page_size, clamping page >= 1 and page_size within [1, MAX_PAGE_SIZE]."""
-        page = max(1, int(page or 1))
-        page_size = int(page_size or DEFAULT_PAGE_SIZE)
-        if page_size < 1:
-            page_size = DEFAULT_PAGE_SIZE
-        if page_size > MAX_PAGE_SIZE:
-            page_size = MAX_PAGE_SIZE
-        total_pages = max(ceil(total / page_size) if page_size else 1, 1)
-        return PageMeta(page=page, page_size=page_size, total=total, total_pages=total_pages)
+    def build(total: Optional[int], page: int, page_size: int, next_cursor: Optional[str] = None) -> "PageMeta":
+        """Build a PageMeta given total, page and page_size, clamping page >= 1 and page_size within [1, MAX_PAGE_SIZE].
+
+        A total of None (cursor pagination) leaves total and total_pages unset. The values are
+        clamped here, so the model is constructed without re-running field validation.
+        """
+        page, page_size = _clamp(page, page_size)
+        if total is None:
+            return PageMeta.model_construct(page=page, page_size=page_size, next_cursor=next_cursor)
+        total_pages = max(1, (total + page_size - 1) // page_size)
+        return PageMeta.model_construct(
+            page=page, page_size=page_size, total=total, total_pages=total_pages, next_cursor=next_cursor
+        )
 
 
 class Paginated(PydBaseModel, Generic[T]):
@@ -39,21 +66,190 @@ class Paginated(PydBaseModel, Generic[T]):
     meta: PageMeta = Field(..., description="Pagination metadata")
 
 
+# PUBLIC_INTERFACE
+def paginated_response(page: Paginated[Any]) -> Response:
+    """Serialize an already-validated page straight to a JSON response.
+
+    Returning a Response skips FastAPI's response_model pass, which would otherwise
+    re-validate and re-encode every item; response_model still documents the schema. The
+    core serializer's bytes are used as the body directly, where model_dump_json would
+    decode them to str only for Response to encode them again.
+    """
+    return Response(content=page.__pydantic_serializer__.to_json(page), media_type="application/json")
+
+
+# PUBLIC_INTERFACE
+def orm_page_response(
+    page_model: Type[Paginated[Any]], adapter: TypeAdapter[List[Any]], items: Sequence[Any], meta: PageMeta
+) -> Response:
+    """Validate a page of ORM rows and serialize it with paginated_response.
+
+    The adapter (a module-level TypeAdapter(List[ItemRead])) validates the whole page in a
+    single pydantic-core call instead of one model_validate per row.
+
+    Parameters:
+        page_model: Concrete Paginated[ItemRead] model for the response.
+        adapter: TypeAdapter over List[ItemRead].
+        items: ORM rows for the page.
+        meta: Pagination metadata.
+
+    Returns:
+        Response: The serialized page.
+    """
+    return paginated_response(page_model(items=adapter.validate_python(items, from_attributes=True), meta=meta))
+
+
 # PUBLIC_INTERFACE
 def sanitize_pagination(page: int | None, page_size: int | None) -> Tuple[int, int]:
     """Clamp and sanitize pagination inputs, enforcing sensible limits."""
-    page = max(1, int(page or 1))
-    size = int(page_size or DEFAULT_PAGE_SIZE)
-    if size < 1:
-        size = DEFAULT_PAGE_SIZE
-    if size > MAX_PAGE_SIZE:
-        size = MAX_PAGE_SIZE
-    return page, size
+    return _clamp(page, page_size)
 
 
 # PUBLIC_INTERFACE
 def offset_limit(page: int, page_size: int) -> Tuple[int, int]:
-    """Return (offset, limit) for the given page and page_size."""
-    page, page_size = sanitize_pagination(page, page_size)
+    """Return (offset, limit) for the given page and page_size.
+
+    OFFSET makes the database walk and discard every earlier row, so deep pages get slower;
+    list endpoints also accept a keyset cursor (encode_cursor / seek_after) that seeks
+    straight to the next page instead.
+    """
+    page, page_size = _clamp(page, page_size)
     offset = (page - 1) * page_size
     return offset, page_size
+
+
+# PUBLIC_INTERFACE
+def encode_cursor(sort_key: str, last_id: str) -> str:
+    """Encode the sort value and id of the last row on a page as an opaque keyset cursor."""
+    raw = json.dumps([sort_key, last_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+# PUBLIC_INTERFACE
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Decode a cursor produced by encode_cursor back into (sort_key, last_id).
+
+    Raises:
+        HTTPException 400: If the cursor is malformed.
+    """
+    try:
+        value = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from e
+    if not (isinstance(value, list) and len(value) == 2 and all(isinstance(v, str) for v in value)):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return value[0], value[1]
+
+
+def _sort_key_column(db: Session, sort_column: Any) -> Any:
+    """The sort column as compared and carried in cursors.
+
+    SQLite keeps timestamps as text, and a bound datetime renders with microseconds that
+    CURRENT_TIMESTAMP values lack, so there the column is compared as its raw stored text.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        return type_coerce(sort_column, String)
+    return sort_column
+
+
+# PUBLIC_INTERFACE
+def seek_after(
+    model: Any, sort_column: Any, sort_key: str, last_id: str, *, descending: bool
+) -> ColumnElement[bool]:
+    """Keyset condition selecting rows after (sort_key, last_id) under ORDER BY (sort_column, model.id).
+
+    The position comes entirely from the cursor, so it stays valid when the row it was taken
+    from is updated or deleted. DateTime keys are ISO strings and are bound with the
+    column's own type.
+    """
+    value: Any = sort_key
+    if isinstance(sort_column.type, DateTime):
+        try:
+            value = datetime.fromisoformat(sort_key)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from e
+    ref = literal(value, type_=sort_column.type)
+    if descending:
+        return or_(sort_column < ref, and_(sort_column == ref, model.id < last_id))
+    return or_(sort_column > ref, and_(sort_column == ref, model.id > last_id))
+
+
+# PUBLIC_INTERFACE
+def fetch_page(
+    db: Session,
+    stmt: Select,
+    *,
+    model: Any,
+    sort_column: Any,
+    descending: bool,
+    page: int,
+    page_size: int,
+    cursor: Optional[str],
+    count_stmt: Optional[Select] = None,
+    window_total: bool = False,
+) -> Tuple[List[Any], PageMeta]:
+    """Run a list query with page-number or keyset pagination.
+
+    Rows are ordered by (sort_column, model.id). Given a cursor, the rows after the
+    (sort value, id) it carries are returned by seeking instead of skipping OFFSET rows, and
+    no total is computed. Otherwise
+    the total comes from count_stmt, or is left unset when count_stmt is None. With
+    window_total the total is read from a COUNT(*) OVER () column on the page query instead,
+    and count_stmt only runs for a page past the end. One extra row is fetched to tell
+    whether another page follows.
+
+    Parameters:
+        db: Session to run the queries on.
+        stmt: Filtered select whose first column is the model entity.
+        model: ORM model being listed; its id breaks ties in the ordering.
+        sort_column: Primary sort column.
+        descending: Whether to sort newest/largest first.
+        page: Page number (1-based), ignored when a cursor is given.
+        page_size: Items per page.
+        cursor: Keyset cursor from a previous page's meta.next_cursor.
+        count_stmt: COUNT query for meta.total in page mode.
+        window_total: Count through a window function on the page query.
+
+    Returns:
+        (items, meta): The page's entities and its PageMeta.
+
+    Raises:
+        HTTPException 400: If the cursor is malformed.
+    """
+    off, lim = offset_limit(page, page_size)
+    key_column = _sort_key_column(db, sort_column)
+    stmt = stmt.add_columns(key_column.label("sort_key"))
+    total: Optional[int] = None
+    if cursor:
+        sort_key, last_id = decode_cursor(cursor)
+        stmt = stmt.where(seek_after(model, key_column, sort_key, last_id, descending=descending))
+        off = 0
+    elif window_total:
+        stmt = stmt.add_columns(func.count().over().label("total"))
+    elif count_stmt is not None:
+        total = int(db.scalar(count_stmt) or 0)
+
+    if descending:
+        stmt = stmt.order_by(sort_column.desc(), model.id.desc())
+    else:
+        stmt = stmt.order_by(sort_column.asc(), model.id.asc())
+    rows = db.execute(stmt.offset(off).limit(lim + 1)).all()
+    has_more = len(rows) > lim
+    rows = rows[:lim]
+    items = [row[0] for row in rows]
+
+    if window_total and not cursor:
+        if rows:
+            total = int(rows[0].total)
+        elif off and count_stmt is not None:
+            # Page past the end: no row carried the window total, so count separately.
+            total = int(db.scalar(count_stmt) or 0)
+        else:
+            total = 0
+    next_cursor = None
+    if has_more:
+        sort_key = rows[-1].sort_key
+        if isinstance(sort_key, datetime):
+            sort_key = sort_key.isoformat()
+        next_cursor = encode_cursor(str(sort_key), items[-1].id)
+    return items, PageMeta.build(total=total, page=page, page_size=page_size, next_cursor=next_cursor)